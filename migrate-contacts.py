@@ -10,15 +10,29 @@ Two source patterns handled:
   2. Merged frontmatter: basic-memory fields mixed into single block
 
 Output: YYYYMMDDTHHMMSS--kebab-case-name__contact.md with clean apeople frontmatter
+
+Requires PyYAML (built with libyaml for the fast C loader); frontmatter that
+is not valid YAML falls back to a line-based parser.
 """
 
+import codecs
+import math
 import os
 import re
 import sys
 import stat
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache, partial
 from pathlib import Path
 
+import yaml
+
+try:
+    from yaml import CBaseLoader as BaseLoader
+except ImportError:
+    from yaml import BaseLoader
+
 SOURCE_DIR = Path.home() / "basic-memory" / "people"
 DEST_DIR = Path.home() / "basic-memory" / "people-migrated"
 
@@ -36,6 +50,12 @@ JUNK_FIELDS = {
     "basic_memory_url",
 }
 
+# Tags every migrated contact starts with
+BASE_TAGS = ("contact",)
+
+# Source tags that carry no meaning in apeople
+SKIP_TAGS = frozenset({"person", "relationship"})
+
 # State mapping
 STATE_MAP = {
     "write": "followup",
@@ -52,63 +72,81 @@ STYLE_MAP = {
     "periodic": "periodic",
 }
 
+# Frontmatter block and body. The optional leading group absorbs the false
+# basic-memory block of the double-frontmatter pattern (plus any blank lines
+# before the real block); if it doesn't fit, the regex backtracks to a single
+# (possibly merged) block.
+_FM_RE = re.compile(
+    r"\A(?:---\n.*?\n---\n\s*)?---\n(?P<fm>.*?)\n---\n(?P<body>.*)\Z", re.S
+)
 
-def get_creation_time(filepath):
-    """Get file creation time (birthtime on macOS, mtime fallback)."""
-    st = os.stat(filepath)
-    # macOS has st_birthtime
-    birthtime = getattr(st, "st_birthtime", None)
-    if birthtime:
-        return datetime.fromtimestamp(birthtime)
-    return datetime.fromtimestamp(st.st_mtime)
+# Line-based fallback parser patterns
+_LIST_RE = re.compile(r"^\s+-\s+(.*)")
+_KV_RE = re.compile(r"^(\w[\w_]*)\s*:\s*(.*)")
 
 
-def parse_source_file(filepath):
-    """Parse a basic-memory contact file, handling both mangling patterns."""
-    with open(filepath, "r") as f:
-        raw = f.read()
+class _SlugTable(dict):
+    """str.translate table that drops any character not explicitly mapped."""
 
-    # Split on --- delimiters
-    parts = raw.split("---\n")
+    def __missing__(self, codepoint):
+        self[codepoint] = None
+        return None
 
-    # Pattern 1: Double frontmatter (5+ parts: empty, junk_fm, empty, real_fm, content)
-    # Pattern 2: Merged frontmatter (3 parts: empty, merged_fm, content)
-    # Pattern 3: No frontmatter at all (skip)
 
-    frontmatter_lines = []
-    content = ""
-
-    if len(parts) >= 5:
-        # Double frontmatter: parts[1] is junk, parts[3] is real
-        frontmatter_lines = parts[3].strip().split("\n")
-        content = "---\n".join(parts[4:]) if len(parts) > 4 else ""
-    elif len(parts) >= 3:
-        # Single (possibly merged) frontmatter
-        frontmatter_lines = parts[1].strip().split("\n")
-        content = "---\n".join(parts[2:]) if len(parts) > 2 else ""
-    else:
-        return None  # No frontmatter
+# Slug translation for sanitize_name: keep a-z, 0-9 and hyphens, turn spaces
+# into hyphens, drop everything else
+_SLUG_TABLE = _SlugTable(
+    {ord(c): c for c in "abcdefghijklmnopqrstuvwxyz0123456789-"}
+)
+_SLUG_TABLE[ord(" ")] = "-"
+_HYPHEN_RE = re.compile(r"-+")
+
 
-    # Parse frontmatter into dict, handling multiline values (tags)
+def get_creation_time(st):
+    """Get file creation timestamp in seconds (birthtime on macOS, mtime fallback)."""
+    # macOS has st_birthtime
+    timestamp = getattr(st, "st_birthtime", None) or st.st_mtime
+    # Round to microseconds the way datetime.fromtimestamp does (half-even,
+    # carrying into the next second), then drop them
+    fraction, seconds = math.modf(timestamp)
+    microseconds = round(fraction * 1e6)
+    if microseconds >= 1_000_000:
+        seconds += 1
+    elif microseconds < 0:
+        seconds -= 1
+    return int(seconds)
+
+
+@lru_cache(maxsize=None)
+def format_creation_time(timestamp):
+    """Format a creation timestamp as (identifier, frontmatter date)."""
+    creation_time = datetime.fromtimestamp(timestamp)
+    return (
+        creation_time.strftime("%Y%m%dT%H%M%S"),
+        creation_time.strftime("%Y-%m-%dT%H:%M:%S") + "Z",
+    )
+
+
+def parse_frontmatter_lines(frontmatter):
+    """Parse frontmatter line by line, for blocks that are not valid YAML."""
     data = {}
     current_key = None
     list_values = []
 
-    for line in frontmatter_lines:
+    for line in frontmatter.strip().split("\n"):
         if not line.strip():
             continue
 
         # Check for list continuation
-        list_match = re.match(r"^\s+-\s+(.*)", line)
+        list_match = _LIST_RE.match(line)
         if list_match and current_key:
             list_values.append(list_match.group(1).strip().strip("'\""))
             data[current_key] = list_values
             continue
 
         # Key: value line
-        kv_match = re.match(r"^(\w[\w_]*)\s*:\s*(.*)", line)
+        kv_match = _KV_RE.match(line)
         if kv_match:
-            # Save previous list if any
             current_key = kv_match.group(1)
             value = kv_match.group(2).strip()
 
@@ -121,9 +159,72 @@ def parse_source_file(filepath):
         else:
             current_key = None
 
-    return data, content.strip()
+    return data
+
+
+def parse_source_file(filepath):
+    """Parse a basic-memory contact file, handling both mangling patterns."""
+    with open(filepath, "rb", buffering=0) as f:
+        raw = f.read()
+
+    # A leading UTF-8 BOM or blank lines would defeat the delimiter probe and
+    # _FM_RE anchor
+    if raw.startswith(codecs.BOM_UTF8):
+        raw = raw[len(codecs.BOM_UTF8):]
+    if not raw.startswith(b"---"):
+        raw = raw.lstrip()
+
+    # Cheap byte probes before decoding and parsing: a contact needs a leading
+    # frontmatter delimiter and a name key somewhere in the file. The name
+    # probe is deliberately loose ('name : x' is valid too); the parsers
+    # decide the rest.
+    if not raw.startswith(b"---") or b"name" not in raw:
+        return None
+
+    raw = raw.decode("utf-8")
+    # Binary read skips newline translation; normalize the rare CRLF file
+    if "\r" in raw:
+        raw = raw.replace("\r\n", "\n").replace("\r", "\n")
+
+    # Pattern 1: Double frontmatter (junk block, then real block, then content)
+    # Pattern 2: Merged frontmatter (single block, then content)
+    # Pattern 3: No frontmatter at all (skip)
+    m = _FM_RE.match(raw)
+    if not m:
+        return None  # No frontmatter
+
+    frontmatter = m.group("fm")
+    # basic-memory frontmatter is only loosely YAML: '#' is content, not a
+    # comment, and unquoted @handles or colons in values are common
+    data = None
+    if "#" not in frontmatter:
+        try:
+            # BaseLoader keeps every scalar a string (no octal, bool, date)
+            data = yaml.load(frontmatter, Loader=BaseLoader)
+        except yaml.YAMLError:
+            pass
+    # Only tags may be a collection; a flow list or mapping anywhere else
+    # (name: [X, Y]) is kept as literal text, like the line parser does
+    if not isinstance(data, dict) or any(
+        not isinstance(value, str)
+        for key, value in data.items()
+        if key != "tags"
+    ):
+        data = parse_frontmatter_lines(frontmatter)
+
+    # Keys without a value are treated as absent
+    data = {key: value for key, value in data.items() if value != ""}
+
+    tags = data.get("tags")
+    if isinstance(tags, str):
+        data["tags"] = [tags]
+    elif isinstance(tags, list):
+        data["tags"] = [tag for tag in tags if isinstance(tag, str)]
+
+    return data, m.group("body").strip()
 
 
+@lru_cache(maxsize=1024)
 def clean_company(company):
     """Clean company field: strip semicolons, unescape commas."""
     if not company:
@@ -140,34 +241,45 @@ def clean_company(company):
 
 def sanitize_name(name):
     """Convert name to kebab-case slug."""
-    slug = name.lower()
-    slug = slug.replace(" ", "-")
-    # Remove special characters, keep only alphanumeric and hyphens
-    slug = re.sub(r"[^a-z0-9-]", "", slug)
+    # Spaces become hyphens; anything but alphanumerics and hyphens is dropped
+    slug = name.lower().translate(_SLUG_TABLE)
     # Collapse multiple hyphens
-    slug = re.sub(r"-+", "-", slug)
+    slug = _HYPHEN_RE.sub("-", slug)
     return slug.strip("-")
 
 
-def build_apeople_frontmatter(data, directory_type, filepath):
-    """Build clean apeople YAML frontmatter from parsed data."""
+def build_apeople_frontmatter(
+    data,
+    directory_type,
+    st,
+    updated_at,
+    _state_map=STATE_MAP,
+    _style_map=STYLE_MAP,
+    _strptime=datetime.strptime,
+    _base_tags=BASE_TAGS,
+    _skip_tags=SKIP_TAGS,
+):
+    """Build clean apeople YAML frontmatter from parsed data.
+
+    The underscore defaults bind module globals as fast locals; callers
+    should not pass them.
+    """
     name = data.get("name", "")
     if not name:
         return None
 
-    creation_time = get_creation_time(filepath)
-    identifier = creation_time.strftime("%Y%m%dT%H%M%S")
+    identifier, date = format_creation_time(get_creation_time(st))
 
     # Relationship type from field or directory
     rel_type = data.get("relationship", directory_type)
 
     # Contact style
     raw_style = data.get("contact_style", "")
-    contact_style = STYLE_MAP.get(raw_style, "periodic")
+    contact_style = _style_map.get(raw_style, "periodic")
 
     # State
     raw_state = data.get("state", "ok")
-    state = STATE_MAP.get(raw_state, "ok")
+    state = _state_map.get(raw_state, "ok")
 
     # Archived overrides state
     archived = data.get("archived", "false")
@@ -185,59 +297,65 @@ def build_apeople_frontmatter(data, directory_type, filepath):
             break
 
     # Build tags list: always include contact, add relationship type
-    tags = ["contact"]
-    # Add meaningful tags (skip @handles, 'person', 'relationship')
-    skip_tags = {"person", "relationship"}
+    tags = list(_base_tags)
+    seen = set(_base_tags)
+    # Add meaningful tags (skip @handles, 'person', 'relationship', dupes)
     for tag in raw_tags:
-        if tag.startswith("@"):
-            continue
-        if tag in skip_tags:
+        if not tag or tag.startswith("@") or tag in _skip_tags or tag in seen:
             continue
-        if tag and tag not in tags:
-            tags.append(tag)
+        seen.add(tag)
+        tags.append(tag)
 
-    # Build frontmatter
-    lines = []
-    lines.append(f"title: {name}")
-    lines.append(f"date: {creation_time.strftime('%Y-%m-%dT%H:%M:%S')}Z")
-    lines.append(f"tags: [{', '.join(tags)}]")
-    lines.append(f"identifier: {identifier}")
-
-    if data.get("email"):
-        lines.append(f"email: {data['email']}")
+    # Optional lines, each carrying its own newline
+    email_line = f"email: {data['email']}\n" if data.get("email") else ""
+    phone_line = ""
     if data.get("phone"):
         phone = data["phone"].strip("'\"")
-        lines.append(f"phone: \"{phone}\"")
+        phone_line = f"phone: \"{phone}\"\n"
 
-    lines.append(f"relationship_type: {rel_type}")
-    lines.append(f"contact_style: {contact_style}")
-    lines.append(f"state: {state}")
-
-    if label:
-        lines.append(f"label: \"{label}\"")
+    label_line = f"label: \"{label}\"\n" if label else ""
 
     company = clean_company(data.get("company", ""))
-    if company:
-        lines.append(f"company: \"{company}\"")
+    company_line = f"company: \"{company}\"\n" if company else ""
 
     # Last contacted
+    last_contacted_line = ""
     last_contact = data.get("last_contact", "")
     if last_contact:
         last_contact = last_contact.strip("'\"")
         # Parse the date and add time component
         try:
-            dt = datetime.strptime(last_contact, "%Y-%m-%d")
-            lines.append(f"last_contacted: {dt.strftime('%Y-%m-%dT%H:%M:%S')}Z")
+            dt = _strptime(last_contact, "%Y-%m-%d")
+            last_contacted_line = (
+                f"last_contacted: {dt.strftime('%Y-%m-%dT%H:%M:%S')}Z\n"
+            )
         except ValueError:
             pass
 
-    lines.append(f"updated_at: {datetime.now().strftime('%Y-%m-%dT%H:%M:%S')}Z")
-
-    return identifier, name, "\n".join(lines)
+    tags_str = ", ".join(tags)
 
-
-def migrate_file(filepath, directory_type):
-    """Migrate a single contact file. Returns (dest_filename, content) or None."""
+    # Build frontmatter
+    frontmatter = (
+        f"title: {name}\n"
+        f"date: {date}\n"
+        f"tags: [{tags_str}]\n"
+        f"identifier: {identifier}\n"
+        f"{email_line}"
+        f"{phone_line}"
+        f"relationship_type: {rel_type}\n"
+        f"contact_style: {contact_style}\n"
+        f"state: {state}\n"
+        f"{label_line}"
+        f"{company_line}"
+        f"{last_contacted_line}"
+        f"updated_at: {updated_at}"
+    )
+
+    return identifier, name, frontmatter
+
+
+def migrate_file(filepath, directory_type, st, updated_at):
+    """Migrate a single contact file. Returns (dest_filename, utf-8 bytes) or None."""
     result = parse_source_file(filepath)
     if result is None:
         return None
@@ -248,7 +366,7 @@ def migrate_file(filepath, directory_type):
     if "name" not in data:
         return None
 
-    fm_result = build_apeople_frontmatter(data, directory_type, filepath)
+    fm_result = build_apeople_frontmatter(data, directory_type, st, updated_at)
     if fm_result is None:
         return None
 
@@ -261,7 +379,59 @@ def migrate_file(filepath, directory_type):
     if content:
         output += f"\n{content}\n"
 
-    return dest_filename, output
+    return dest_filename, output.encode("utf-8")
+
+
+def write_output(dest_path, blob):
+    """Write bytes to dest_path atomically via a staging file and os.replace.
+
+    Uses os.write directly, bypassing io buffering. An interrupted run never
+    leaves a half-written contact behind.
+    """
+    tmp_path = dest_path.with_suffix(dest_path.suffix + f".tmp{os.getpid()}")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(blob)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, dest_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def migrate_file_worker(task, updated_at):
+    """Run migrate_file in a worker process. Returns (result, error)."""
+    try:
+        return migrate_file(*task, updated_at), None
+    except Exception as e:
+        return None, str(e)
+
+
+def collect_tasks():
+    """List (filepath, directory_type, stat) tuples in migration order."""
+    tasks = []
+    with os.scandir(SOURCE_DIR) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        if entry.is_file() and entry.name.endswith(".md"):
+            # Root-level files
+            tasks.append((Path(entry.path), "", entry.stat()))
+        elif entry.is_dir():
+            with os.scandir(entry.path) as it:
+                md_files = sorted(
+                    (e for e in it if e.name.endswith(".md") and e.is_file()),
+                    key=lambda e: e.name,
+                )
+            for md_file in md_files:
+                tasks.append((Path(md_file.path), entry.name, md_file.stat()))
+    return tasks
 
 
 def main():
@@ -275,69 +445,59 @@ def main():
     skipped = 0
     errors = []
     seen_filenames = {}
-
-    # Walk all subdirectories
-    for item in sorted(SOURCE_DIR.iterdir()):
-        if item.is_file() and item.suffix == ".md":
-            # Root-level files
-            if item.name in SKIP_FILES:
-                print(f"  SKIP (non-contact): {item.name}")
+    # Next collision suffix to try per base name
+    collision_counter = {}
+
+    # One timestamp for the whole run
+    updated_at = datetime.now().strftime("%Y-%m-%dT%H:%M:%S") + "Z"
+
+    tasks = collect_tasks()
+    work = [task for task in tasks if task[0].name not in SKIP_FILES]
+
+    # Parse and build in parallel; collisions and writes stay serial so
+    # output filenames are deterministic
+    with ProcessPoolExecutor() as ex:
+        results = ex.map(
+            partial(migrate_file_worker, updated_at=updated_at), work, chunksize=32
+        )
+        current_dir = ""
+        for filepath, directory_type, _ in tasks:
+            if directory_type != current_dir:
+                current_dir = directory_type
+                if directory_type:
+                    print(f"\n=== {directory_type}/ ===")
+
+            if filepath.name in SKIP_FILES:
+                print(f"  SKIP (non-contact): {filepath.name}")
                 skipped += 1
                 continue
 
-            result = migrate_file(item, "")
-            if result:
-                dest_filename, content = result
-                # Handle filename collisions
-                if dest_filename in seen_filenames:
-                    # Append a counter
-                    base = dest_filename.replace("__contact.md", "")
-                    counter = 2
-                    while f"{base}-{counter}__contact.md" in seen_filenames:
-                        counter += 1
-                    dest_filename = f"{base}-{counter}__contact.md"
-                seen_filenames[dest_filename] = item
-                dest_path = DEST_DIR / dest_filename
-                with open(dest_path, "w") as f:
-                    f.write(content)
-                print(f"  OK: {item.name} -> {dest_filename}")
-                migrated += 1
-            else:
-                print(f"  SKIP (no name): {item.name}")
+            result, error = next(results)
+            if error is not None:
+                print(f"  ERROR: {filepath.name}: {error}")
+                errors.append((filepath.name, error))
+                continue
+            if result is None:
+                print(f"  SKIP (parse failed): {filepath.name}")
                 skipped += 1
+                continue
 
-        elif item.is_dir():
-            directory_type = item.name
-            print(f"\n=== {directory_type}/ ===")
-            for md_file in sorted(item.glob("*.md")):
-                if md_file.name in SKIP_FILES:
-                    print(f"  SKIP (non-contact): {md_file.name}")
-                    skipped += 1
-                    continue
-
-                try:
-                    result = migrate_file(md_file, directory_type)
-                    if result:
-                        dest_filename, content = result
-                        # Handle filename collisions
-                        if dest_filename in seen_filenames:
-                            base = dest_filename.replace("__contact.md", "")
-                            counter = 2
-                            while f"{base}-{counter}__contact.md" in seen_filenames:
-                                counter += 1
-                            dest_filename = f"{base}-{counter}__contact.md"
-                        seen_filenames[dest_filename] = md_file
-                        dest_path = DEST_DIR / dest_filename
-                        with open(dest_path, "w") as f:
-                            f.write(content)
-                        print(f"  OK: {md_file.name} -> {dest_filename}")
-                        migrated += 1
-                    else:
-                        print(f"  SKIP (parse failed): {md_file.name}")
-                        skipped += 1
-                except Exception as e:
-                    print(f"  ERROR: {md_file.name}: {e}")
-                    errors.append((md_file.name, str(e)))
+            dest_filename, blob = result
+            # Handle filename collisions
+            if dest_filename in seen_filenames:
+                # Append a counter, resuming from the last one used for this
+                # base; the loop only steps past names that already exist
+                base = dest_filename.replace("__contact.md", "")
+                counter = collision_counter.get(base, 2)
+                while f"{base}-{counter}__contact.md" in seen_filenames:
+                    counter += 1
+                collision_counter[base] = counter + 1
+                dest_filename = f"{base}-{counter}__contact.md"
+            seen_filenames[dest_filename] = filepath
+            dest_path = DEST_DIR / dest_filename
+            write_output(dest_path, blob)
+            print(f"  OK: {filepath.name} -> {dest_filename}")
+            migrated += 1
 
     print(f"\n{'='*60}")
     print(f"Migrated: {migrated}")
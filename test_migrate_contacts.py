@@ -0,0 +1,176 @@
+"""Regression checks for migrate-contacts.py.
+
+Run with: python -m unittest test_migrate_contacts
+"""
+
+import importlib.util
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+_SPEC = importlib.util.spec_from_file_location(
+    "migrate_contacts", Path(__file__).with_name("migrate-contacts.py")
+)
+migrate = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(migrate)
+
+UPDATED_AT = "2026-01-01T00:00:00Z"
+
+
+class MigrateFileTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def migrate_text(self, text):
+        """Migrate a file with these contents; return (filename, fields, body)."""
+        path = self.tmp / "contact.md"
+        path.write_text(text, encoding="utf-8")
+        result = migrate.migrate_file(path, "friends", os.stat(path), UPDATED_AT)
+        self.assertIsNotNone(result)
+        dest_filename, blob = result
+        output = blob.decode("utf-8").removeprefix("---\n")
+        fm, _, body = output.partition("\n---\n")
+        fields = dict(line.split(": ", 1) for line in fm.splitlines())
+        return dest_filename, fields, body.strip()
+
+    def migrate(self, frontmatter, body="Notes\n", prefix=""):
+        """Migrate a file with the given frontmatter; return (filename, fields)."""
+        dest_filename, fields, _ = self.migrate_text(
+            f"{prefix}---\n{frontmatter}\n---\n{body}"
+        )
+        return dest_filename, fields
+
+    def test_double_frontmatter(self):
+        _, fields, body = self.migrate_text(
+            "---\ntitle: junk\ntype: note\n---\n"
+            "---\nname: Carol\nemail: c@x.com\n---\nbody\n"
+        )
+        self.assertEqual(fields["title"], "Carol")
+        self.assertEqual(fields["email"], "c@x.com")
+        self.assertEqual(body, "body")
+
+    def test_double_frontmatter_separated_by_blank_line(self):
+        _, fields, body = self.migrate_text(
+            "---\ntitle: junk\n---\n\n---\nname: Carol\n---\nbody\n"
+        )
+        self.assertEqual(fields["title"], "Carol")
+        self.assertEqual(body, "body")
+
+    def test_merged_frontmatter_body_with_rules(self):
+        _, fields, body = self.migrate_text(
+            "---\nname: Dana\n---\nA\n---\nB\n---\nC\n"
+        )
+        self.assertEqual(fields["title"], "Dana")
+        self.assertEqual(body, "A\n---\nB\n---\nC")
+
+    def test_unquoted_handle_in_tag_list(self):
+        _, fields = self.migrate("name: Bobby\ntags:\n  - friend\n  - @bobby")
+        self.assertEqual(fields["label"], '"@bobby"')
+        self.assertEqual(fields["tags"], "[contact, friend]")
+
+    def test_unquoted_handle_as_scalar_tag(self):
+        _, fields = self.migrate("name: Bobby\ntags: @bobby")
+        self.assertEqual(fields["label"], '"@bobby"')
+
+    def test_colon_in_value(self):
+        _, fields = self.migrate("name: Dr. Who: Time Lord")
+        self.assertEqual(fields["title"], "Dr. Who: Time Lord")
+
+    def test_tab_indented_line(self):
+        _, fields = self.migrate("name: Tabby\n\tnotes: indented")
+        self.assertEqual(fields["title"], "Tabby")
+
+    def test_alias_like_value(self):
+        _, fields = self.migrate("name: Starry\nnotes: *important*")
+        self.assertEqual(fields["title"], "Starry")
+
+    def test_phone_keeps_leading_zero(self):
+        _, fields = self.migrate("name: Zero\nphone: 0123456")
+        self.assertEqual(fields["phone"], '"0123456"')
+
+    def test_archived_yes_is_not_archived(self):
+        _, fields = self.migrate("name: Yes Man\narchived: yes")
+        self.assertEqual(fields["state"], "ok")
+
+    def test_hash_is_not_a_comment(self):
+        dest_filename, fields = self.migrate("name: Sam #1\ncompany: #hash co")
+        self.assertEqual(fields["title"], "Sam #1")
+        self.assertEqual(fields["company"], '"#hash co"')
+        self.assertIn("--sam-1__contact.md", dest_filename)
+
+    def test_unquoted_date_stays_a_string(self):
+        _, fields = self.migrate("name: Dated\nlast_contact: 2024-01-15")
+        self.assertEqual(fields["last_contacted"], "2024-01-15T00:00:00Z")
+
+    def test_space_before_name_colon(self):
+        _, fields = self.migrate("name : Spaced")
+        self.assertEqual(fields["title"], "Spaced")
+
+    def test_utf8_bom(self):
+        _, fields = self.migrate("name: Bom", prefix="\ufeff")
+        self.assertEqual(fields["title"], "Bom")
+
+    def test_leading_blank_lines(self):
+        _, fields = self.migrate("name: Ivy", prefix="\n \n")
+        self.assertEqual(fields["title"], "Ivy")
+
+    def test_flow_collections_outside_tags_stay_text(self):
+        dest_filename, fields = self.migrate(
+            "name: [X, Y]\ncompany: [A, B]\nphone: [1, 2]\nemail: {a: b}\n"
+            "relationship: [work]\nlast_contact: [2024-01-15]\ntags: [friend]"
+        )
+        self.assertEqual(fields["title"], "[X, Y]")
+        self.assertEqual(fields["company"], '"[A, B]"')
+        self.assertEqual(fields["phone"], '"[1, 2]"')
+        self.assertEqual(fields["email"], "{a: b}")
+        self.assertEqual(fields["relationship_type"], "[work]")
+        self.assertNotIn("last_contacted", fields)
+        self.assertIn("--x-y__contact.md", dest_filename)
+
+
+class CreationTimeTest(unittest.TestCase):
+    def test_rounds_like_datetime_fromtimestamp(self):
+        for timestamp in (
+            1700000000.9999996,
+            1700000000.9999994,
+            1700000000.0000004,
+            1700000000.5,
+            1700000000.0,
+        ):
+            expected = datetime.fromtimestamp(timestamp).strftime("%Y%m%dT%H%M%S")
+            st = SimpleNamespace(st_mtime=timestamp)
+            identifier, _ = migrate.format_creation_time(
+                migrate.get_creation_time(st)
+            )
+            self.assertEqual(identifier, expected, timestamp)
+
+
+class CollectTasksTest(unittest.TestCase):
+    def test_dotfiles_collected_at_root_and_in_subdirectories(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp)
+            (source / "work").mkdir()
+            for path in (source / ".a.md", source / "work" / ".b.md",
+                         source / "work" / "c.md", source / "work" / "d.txt"):
+                path.write_text("")
+            original = migrate.SOURCE_DIR
+            migrate.SOURCE_DIR = source
+            try:
+                tasks = migrate.collect_tasks()
+            finally:
+                migrate.SOURCE_DIR = original
+        self.assertEqual(
+            [(path.name, directory_type) for path, directory_type, _ in tasks],
+            [(".a.md", ""), (".b.md", "work"), ("c.md", "work")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()